@@ -7,69 +7,219 @@ USAGE:
   
   # Export to CSV
   source venv/bin/activate && python final_scraper.py "https://assets.contentstack.io/v3/assets/blteb7d012fc7ebef7f/blt15de1b02b6a6b656/6855e02a84e9fc2bb2dbdfc2/schedule_(2).pdf" "2025 USAW National Championships" --csv final_schedule.csv
+  
+  # Fall back to the pdfplumber backend if PyMuPDF mis-detects a table
+  source venv/bin/activate && python final_scraper.py "https://assets.contentstack.io/v3/assets/blteb7d012fc7ebef7f/blt15de1b02b6a6b656/6855e02a84e9fc2bb2dbdfc2/schedule_(2).pdf" "2025 USAW National Championships" --dry-run --backend pdfplumber
 """
 
 import os
 import re
+import sys
+import calendar
+import functools
+import mmap
+import shutil
+import tempfile
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
-from datetime import datetime, time as datetime_time
-from typing import List, Dict, Optional
+from datetime import time as datetime_time
+from typing import List, Dict, Optional, Iterator
 import pdfplumber
+import pymupdf
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import pandas as pd
-from tabulate import tabulate
 
 # Load environment variables
 load_dotenv()
 
+PDF_BACKENDS = ('pymupdf', 'pdfplumber')
+
+# Below this many pages, process start-up costs more than parallel table finding saves
+PARALLEL_MIN_PAGES = 8
+
+# Pages with less text than this (covers, footers) cannot hold a schedule table
+MIN_TABLE_PAGE_CHARS = 50
+
+# Upserts are sent in bounded batches (PostgREST payload limits) over a few concurrent requests
+UPSERT_CHUNK_SIZE = 500
+UPSERT_WORKERS = 4
+
+# Dry runs only preview the first rows of the new entries
+PREVIEW_ROWS = 50
+
+# Precompiled patterns used on every table row
+_MONTHS = 'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(am|pm)?', re.I)
+_DATE_RE = re.compile(rf'({_MONTHS})\s+(\d{{1,2}})')
+_MONTH_TOKEN_RE = re.compile(rf'\b({_MONTHS})\b')
+_GROUP_SUFFIX_RE = re.compile(r'\s+[A-E]$')
+
+# Database columns: the unique constraint, and the fields compared in a dry run
+_KEY_COLUMNS = ['meet', 'session_id', 'platform', 'weight_class']
+_COMPARE_COLUMNS = ['date', 'start_time', 'weigh_in_time']
+_ENTRY_COLUMNS = ['date', 'session_id', 'start_time', 'weigh_in_time', 'platform', 'weight_class', 'meet']
+
+_VALID_PLATFORMS = frozenset(('RED', 'WHITE', 'BLUE'))
+_PLATFORM_CAP = {'RED': 'Red', 'WHITE': 'White', 'BLUE': 'Blue'}
+
+_MONTH_MAP = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+
+# PDF opened once per worker process by _init_page_worker
+_worker_doc = None
+
+
+def _find_page_tables(doc, page_index: int) -> List[List[List]]:
+    """Run PyMuPDF's table finder on a single page and return the extracted tables"""
+    page = doc.load_page(page_index)
+    
+    # Text extraction is far cheaper than table detection, so skip near-empty pages up front
+    if len(page.get_text()) < MIN_TABLE_PAGE_CHARS:
+        return []
+    
+    return [table.extract() for table in page.find_tables().tables]
+
+
+def _init_page_worker(pdf_bytes: bytes):
+    """Open the PDF once in each worker instead of shipping it with every page"""
+    global _worker_doc
+    _worker_doc = pymupdf.open(stream=pdf_bytes, filetype='pdf')
+
+
+def _find_worker_page_tables(page_index: int) -> List[List[List]]:
+    """Process-pool entry point: find tables on one page of the worker's PDF"""
+    return _find_page_tables(_worker_doc, page_index)
+
+
+def _install_orjson_response_parser():
+    """Make httpx (and so the Supabase client) parse JSON responses with orjson instead of stdlib json"""
+    if getattr(httpx.Response.json, 'uses_orjson', False):
+        return
+    
+    stdlib_json = httpx.Response.json
+    
+    def json(self, **kwargs):
+        if kwargs:  # json.loads-specific options; only the stdlib parser understands them
+            return stdlib_json(self, **kwargs)
+        return orjson.loads(self.content)
+    
+    json.uses_orjson = True
+    httpx.Response.json = json
+
 
 class FinalScheduleScraper:
     """Scraper for extracting FINAL schedule data from OWLCMS PDFs"""
     
-    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None):
-        """Initialize the scraper with Supabase credentials"""
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 backend: str = 'pymupdf', workers: Optional[int] = None):
+        """Initialize the scraper with Supabase credentials, the PDF backend and page worker count"""
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend '{backend}'. Choose one of: {', '.join(PDF_BACKENDS)}")
+        
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
         self.supabase_url = supabase_url or os.getenv('SUPABASE_URL')
         self.supabase_key = supabase_key or os.getenv('SUPABASE_KEY')
         
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("Supabase credentials not found. Set SUPABASE_URL and SUPABASE_KEY in .env")
         
+        _install_orjson_response_parser()
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
         self.current_date = None
+        
+        # Shared session so repeated downloads from the same host reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
     
     def download_pdf(self, url: str) -> BytesIO:
         """Download PDF from URL"""
         print(f"Downloading PDF from {url}...")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return BytesIO(response.content)
+        pdf_file = BytesIO()
+        with self._session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Stream straight into the buffer instead of materializing response.content first
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, pdf_file, length=65536)
+        
+        pdf_file.seek(0)
+        return pdf_file
     
     def extract_schedule_data(self, pdf_file: BytesIO, meet_name: str) -> List[Dict]:
         """Extract schedule data from PDF"""
         print("Extracting data from PDF...")
         schedule_entries = []
         
-        with pdfplumber.open(pdf_file) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                print(f"Processing page {page_num}/{len(pdf.pages)}...")
-                
-                tables = page.extract_tables()
-                
-                if not tables:
+        if self.backend == 'pdfplumber':
+            page_tables = self._extract_tables_pdfplumber(pdf_file)
+        else:
+            page_tables = self._extract_tables_pymupdf(pdf_file)
+        
+        for tables in page_tables:
+            for table in tables:
+                if not table or len(table) < 2:
                     continue
                 
-                for table in tables:
-                    if not table or len(table) < 2:
-                        continue
-                    
-                    entries = self._parse_table(table, meet_name)
-                    schedule_entries.extend(entries)
+                entries = self._parse_table(table, meet_name)
+                schedule_entries.extend(entries)
         
         print(f"Extracted {len(schedule_entries)} schedule entries")
         return schedule_entries
     
+    def _extract_tables_pymupdf(self, pdf_file: BytesIO) -> Iterator[List[List[List]]]:
+        """Yield the tables found on each page using PyMuPDF's native table finder"""
+        pdf_bytes = pdf_file.getvalue()
+        
+        with pymupdf.open(stream=pdf_bytes, filetype='pdf') as doc:
+            total_pages = len(doc)
+            
+            if self.workers < 2 or total_pages < PARALLEL_MIN_PAGES:
+                for page_index in range(total_pages):
+                    print(f"Processing page {page_index + 1}/{total_pages}...")
+                    yield _find_page_tables(doc, page_index)
+                return
+        
+        # Pages are independent, so find tables in parallel; results come back in page order
+        # and _parse_table (which carries date/session state across pages) still runs serially
+        # Every worker opens the whole PDF, so never start more of them than there are pages
+        workers = min(self.workers, total_pages)
+        print(f"Processing {total_pages} pages with {workers} workers...")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                                 initargs=(pdf_bytes,)) as executor:
+            for page_num, tables in enumerate(executor.map(_find_worker_page_tables, range(total_pages)), 1):
+                print(f"Processing page {page_num}/{total_pages}...")
+                yield tables
+    
+    def _extract_tables_pdfplumber(self, pdf_file: BytesIO) -> Iterator[List[List[List]]]:
+        """Yield the tables found on each page using pdfplumber (slower, pure Python)"""
+        # pdfminer seeks all over the file (xref, objects); a memory-mapped temp file turns
+        # those into page faults instead of Python-level BytesIO reads
+        with tempfile.NamedTemporaryFile(suffix='.pdf') as tmp:
+            tmp.write(pdf_file.getbuffer())
+            tmp.flush()
+            
+            with mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ) as mm, pdfplumber.open(mm) as pdf:
+                pages = pdf.pages
+                total_pages = len(pages)
+                
+                for page_num, page in enumerate(pages, 1):
+                    print(f"Processing page {page_num}/{total_pages}...")
+                    
+                    # Skip table detection on near-empty pages (covers, footers)
+                    tables = page.extract_tables() if len(page.chars) >= MIN_TABLE_PAGE_CHARS else []
+                    page.close()  # Flush pdfminer's cached char/line/rect objects so memory stays flat
+                    yield tables
+    
     def _parse_table(self, table: List[List], meet_name: str) -> List[Dict]:
         """Parse a table from the PDF"""
         entries = []
@@ -81,17 +231,13 @@ class FinalScheduleScraper:
             if not row or len(row) < 7:
                 continue
             
-            # Extract values
-            date_str = str(row[0] or '').strip()
-            session_str = str(row[1] or '').strip()
-            platform = str(row[2] or '').strip()
-            weigh_time_str = str(row[3] or '').strip()
-            start_time_str = str(row[4] or '').strip()
-            weight_category = str(row[6] or '').strip()
+            # Extract values (both backends return cells as str or None)
+            date_str, session_str, platform, weigh_time_str, start_time_str, _, weight_category = (
+                cell.strip() if cell else '' for cell in row[:7]
+            )
             
             # Update current date if present
-            if date_str and any(month in date_str for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                                                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
+            if date_str and _MONTH_TOKEN_RE.search(date_str):
                 parsed_date = self._parse_date_from_short(date_str)
                 if parsed_date:
                     current_date = parsed_date
@@ -100,7 +246,7 @@ class FinalScheduleScraper:
             # Check if this is a new session based on time change (before updating session number)
             is_new_session = False
             if (not session_str and platform == 'RED' and start_time_str and 
-                last_start_time and start_time_str != last_start_time and current_session):
+                last_start_time and start_time_str != last_start_time and current_session is not None):
                 # Detect session boundary: RED platform with different start time means new session
                 is_new_session = True
             
@@ -110,14 +256,15 @@ class FinalScheduleScraper:
                 last_start_time = None  # Reset time tracking on explicit session number
             
             # Skip if we don't have the essential data
-            if not platform or platform not in ['RED', 'WHITE', 'BLUE']:
+            if platform not in _VALID_PLATFORMS:
                 continue
             
             if not start_time_str or not weigh_time_str:
                 continue
             
             # Use local current_date which persists across rows
-            if not current_date or not current_session:
+            # (session 0 is a valid session number, so test for None rather than falsiness)
+            if not current_date or current_session is None:
                 continue
             
             # Parse times
@@ -132,16 +279,17 @@ class FinalScheduleScraper:
                 last_start_time = start_time_str
             
             # Clean weight category (remove group letter like A, B, C, etc)
-            weight_class = re.sub(r'\s+[A-E]$', '', weight_category).strip()
+            # Interned so the thousands of entries share one copy of each repeated string
+            weight_class = sys.intern(_GROUP_SUFFIX_RE.sub('', weight_category, count=1).strip())
             
             # Capitalize platform for consistency
-            platform = platform.capitalize()
+            platform = _PLATFORM_CAP[platform]
             
             entry = {
                 'date': current_date,
                 'session_id': current_session,
-                'start_time': start_time.strftime('%H:%M:%S'),
-                'weigh_in_time': weigh_time.strftime('%H:%M:%S'),
+                'start_time': start_time.isoformat(timespec='seconds'),
+                'weigh_in_time': weigh_time.isoformat(timespec='seconds'),
                 'platform': platform,
                 'weight_class': weight_class,
                 'meet': meet_name
@@ -160,62 +308,47 @@ class FinalScheduleScraper:
         if not time_str:
             return None
         
-        time_str = str(time_str).strip()
+        # Handles 'HH:MM', 'HH:MM:SS' and 'H:MM am/pm' in one pass (no strptime)
+        match = _TIME_RE.search(str(time_str).strip().lower())
+        if not match:
+            return None
         
-        # Try common time formats
-        formats = ['%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M%p']
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        second = int(match.group(3) or 0)
+        am_pm = match.group(4)
         
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(time_str, fmt)
-                return dt.time()
-            except ValueError:
-                continue
+        if am_pm == 'pm' and hour < 12:
+            hour += 12
+        elif am_pm == 'am' and hour == 12:
+            hour = 0
         
-        # Try to extract time using regex
-        match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', time_str.lower())
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            am_pm = match.group(3)
-            
-            if am_pm == 'pm' and hour < 12:
-                hour += 12
-            elif am_pm == 'am' and hour == 12:
-                hour = 0
-            
-            return datetime_time(hour, minute)
+        if hour > 23 or minute > 59 or second > 59:
+            return None
         
-        return None
+        return datetime_time(hour, minute, second)
     
-    def _parse_date_from_short(self, date_str: str) -> Optional[str]:
-        """Parse date from short format like 'Sat\\nJun 21'"""
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_date_from_short(date_str: str) -> Optional[str]:
+        """Parse date from short format like 'Sat\\nJun 21' (cached: the same day repeats across many rows)"""
         if not date_str:
             return None
         
         date_str = str(date_str).strip().replace('\n', ' ')
         
         # Extract month and day
-        match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', date_str)
+        match = _DATE_RE.search(date_str)
         if match:
             month_str = match.group(1)
-            day = match.group(2)
+            day = int(match.group(2))
             
             # Assume current year or next year based on context
             year = 2025  # Hardcode for now, could be made dynamic
             
-            month_map = {
-                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-            }
-            
-            month = month_map.get(month_str)
-            if month:
-                try:
-                    dt = datetime(year, month, int(day))
-                    return dt.strftime('%Y-%m-%d')
-                except ValueError:
-                    pass
+            month = _MONTH_MAP.get(month_str)
+            if month and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return f"{year:04d}-{month:02d}-{day:02d}"
         
         return None
     
@@ -224,22 +357,21 @@ class FinalScheduleScraper:
         formatted = []
         
         for entry in entries:
-            formatted_entry = {
-                'date': entry.get('date'),
-                'session_id': entry.get('session_id'),
-                'start_time': entry.get('start_time'),
-                'weigh_in_time': entry.get('weigh_in_time'),
-                'platform': entry.get('platform'),
-                'weight_class': entry.get('weight_class'),
-                'meet': entry.get('meet')
-            }
-            
-            # Only add if all required fields are present
-            if all(formatted_entry.values()):
-                formatted.append(formatted_entry)
+            # Only add if all required fields are present (entries already use the schema's keys)
+            if (entry['date'] and entry['session_id'] is not None and entry['start_time'] and
+                    entry['weigh_in_time'] and entry['platform'] and entry['weight_class'] and entry['meet']):
+                formatted.append(entry)
         
         return formatted
     
+    def _entries_to_frame(self, entries: List[Dict]) -> pd.DataFrame:
+        """Build a DataFrame from entries column-by-column (much cheaper than pandas' list-of-dicts path)"""
+        if not entries:
+            return pd.DataFrame(columns=_ENTRY_COLUMNS, dtype=object)
+        
+        columns = {col: [entry[col] for entry in entries] for col in _ENTRY_COLUMNS}
+        return pd.DataFrame(columns, copy=False)
+    
     def dry_run(self, meet_name: str, new_entries: List[Dict]) -> Dict:
         """Perform a dry run to see what would be changed"""
         print(f"\n{'='*60}")
@@ -252,62 +384,46 @@ class FinalScheduleScraper:
         print(f"Found {len(existing_records)} existing records for '{meet_name}'")
         print(f"Processing {len(new_entries)} new entries\n")
         
-        # Create comparison based on unique constraint
-        existing_by_key = {}
-        for record in existing_records:
-            key = (
-                record.get('meet'),
-                record.get('session_id'),
-                record.get('platform'),
-                record.get('weight_class')
-            )
-            existing_by_key[key] = record
-        
-        new_by_key = {}
-        for entry in new_entries:
-            key = (
-                entry.get('meet'),
-                entry.get('session_id'),
-                entry.get('platform'),
-                entry.get('weight_class')
-            )
-            new_by_key[key] = entry
+        # Compare on the unique constraint with a single hash join instead of a per-row loop
+        df_new = self._entries_to_frame(new_entries).drop_duplicates(subset=_KEY_COLUMNS, keep='last')
+        df_old = pd.DataFrame(existing_records, columns=_KEY_COLUMNS + _COMPARE_COLUMNS)
+        df_old = df_old.drop_duplicates(subset=_KEY_COLUMNS, keep='last')
+        df_old['date'] = df_old['date'].astype(str)
+        df_old['existing_idx'] = df_old.index
         
-        to_add = []
-        to_update = []
-        unchanged = []
+        merged = df_new.merge(df_old, on=_KEY_COLUMNS, how='left', suffixes=('', '_old'), indicator=True)
         
-        for key, new_entry in new_by_key.items():
-            if key not in existing_by_key:
-                to_add.append(new_entry)
-            else:
-                existing = existing_by_key[key]
-                if (str(existing.get('date')) != new_entry.get('date') or
-                    existing.get('start_time') != new_entry.get('start_time') or
-                    existing.get('weigh_in_time') != new_entry.get('weigh_in_time')):
-                    to_update.append({'existing': existing, 'new': new_entry})
-                else:
-                    unchanged.append(new_entry)
+        in_existing = merged['_merge'] == 'both'
+        changed = ((merged['date'] != merged['date_old']) |
+                   (merged['start_time'] != merged['start_time_old']) |
+                   (merged['weigh_in_time'] != merged['weigh_in_time_old']))
+        
+        to_add = merged.loc[~in_existing, _ENTRY_COLUMNS]
+        to_update = merged.loc[in_existing & changed]
+        unchanged = merged.loc[in_existing & ~changed]
         
         print(f"SUMMARY:")
         print(f"  New entries to add: {len(to_add)}")
         print(f"  Existing entries to update: {len(to_update)}")
         print(f"  Unchanged entries: {len(unchanged)}")
         
-        if to_add:
+        if not to_add.empty:
             print(f"\n{'='*60}")
             print(f"NEW ENTRIES TO ADD ({len(to_add)}):")
             print(f"{'='*60}")
-            df = pd.DataFrame(to_add)
-            print(tabulate(df, headers='keys', tablefmt='grid', showindex=False))
+            print(to_add.head(PREVIEW_ROWS).to_string(index=False))
+            if len(to_add) > PREVIEW_ROWS:
+                print(f"... and {len(to_add) - PREVIEW_ROWS} more")
         
-        if to_update:
+        if not to_update.empty:
             print(f"\n{'='*60}")
             print(f"ENTRIES TO UPDATE ({len(to_update)}):")
             print(f"{'='*60}")
-            for item in to_update[:10]:  # Show first 10
-                print(f"\nExisting: {item['existing']}")
-                print(f"New:      {item['new']}")
+            for item in to_update.head(10).to_dict('records'):  # Show first 10
+                existing = existing_records[int(item['existing_idx'])]
+                new_entry = {col: item[col] for col in _ENTRY_COLUMNS}
+                print(f"\nExisting: {existing}")
+                print(f"New:      {new_entry}")
         
         return {
             'total_new': len(new_entries),
@@ -318,51 +434,65 @@ class FinalScheduleScraper:
         }
     
     def upsert_to_database(self, entries: List[Dict]) -> Dict:
-        """Upsert entries to the database"""
+        """Upsert entries to the database in batches (not atomic: a failed batch does not roll back the others)"""
         if not entries:
             print("No entries to upsert")
             return {'data': [], 'count': 0}
         
         # Deduplicate entries
-        seen = {}
-        for entry in entries:
-            key = (entry['meet'], entry['session_id'], entry['platform'], entry['weight_class'])
-            seen[key] = entry
-        
+        seen = {(e['meet'], e['session_id'], e['platform'], e['weight_class']): e for e in entries}
         deduplicated = list(seen.values())
         
         if len(deduplicated) < len(entries):
             print(f"Warning: Removed {len(entries) - len(deduplicated)} duplicate entries from batch")
         
-        print(f"Upserting {len(deduplicated)} entries to database...")
+        starts = range(0, len(deduplicated), UPSERT_CHUNK_SIZE)
+        chunks = [deduplicated[i:i + UPSERT_CHUNK_SIZE] for i in starts]
+        print(f"Upserting {len(deduplicated)} entries to database in {len(chunks)} batch(es)...")
         
-        response = self.supabase.table('session_schedule').upsert(
-            deduplicated,
-            on_conflict='meet,session_id,platform,weight_class'
-        ).execute()
+        # The postgrest client (and its httpx connection pool) is created lazily on first access;
+        # create it here so the batch threads share one pool instead of each building their own
+        self.supabase.postgrest
+        with ThreadPoolExecutor(max_workers=min(UPSERT_WORKERS, len(chunks))) as executor:
+            futures = [executor.submit(self._upsert_chunk, chunk) for chunk in chunks]
+        
+        # Batches that succeeded stay committed, so report every failed range rather than the first error
+        data = []
+        failed = []
+        for start, chunk, future in zip(starts, chunks, futures):
+            try:
+                data.extend(future.result().data)
+            except Exception as e:
+                failed.append(chunk)
+                print(f"ERROR: Failed to upsert entries {start + 1}-{start + len(chunk)}: {e}")
+        
+        if failed:
+            upserted = len(deduplicated) - sum(len(chunk) for chunk in failed)
+            raise RuntimeError(f"{len(failed)} of {len(chunks)} batch(es) failed after {upserted} entries were "
+                               f"upserted; re-run to upsert the remaining entries")
         
         print(f"Successfully upserted {len(deduplicated)} entries")
-        return response
+        return {'data': data, 'count': len(deduplicated)}
+    
+    def _upsert_chunk(self, chunk: List[Dict]):
+        """Upsert a single batch of entries"""
+        return self.supabase.table('session_schedule').upsert(
+            chunk,
+            on_conflict='meet,session_id,platform,weight_class'
+        ).execute()
     
     def export_to_csv(self, entries: List[Dict], output_file: str):
         """Export entries to CSV file"""
-        import csv
-        
         if not entries:
             print("No entries to export")
             return
         
         print(f"Exporting {len(entries)} entries to {output_file}...")
         
-        with open(output_file, 'w', newline='') as csvfile:
-            fieldnames = ['id', 'date', 'session_id', 'start_time', 'weigh_in_time', 'platform', 'weight_class', 'meet']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for i, entry in enumerate(entries, 1):
-                # Add id field for CSV (not used in database)
-                row = {'id': i, **entry}
-                writer.writerow(row)
+        df = self._entries_to_frame(entries)
+        # Add id field for CSV (not used in database)
+        df.insert(0, 'id', range(1, len(df) + 1))
+        df.to_csv(output_file, index=False, lineterminator='\r\n')
         
         print(f"✓ Successfully exported to {output_file}")
     
@@ -405,10 +535,14 @@ def main():
     parser.add_argument('meet_name', help='Name of the meet/competition')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without actually upserting')
     parser.add_argument('--csv', help='Export to CSV file instead of database (provide filename)')
+    parser.add_argument('--backend', choices=PDF_BACKENDS, default='pymupdf',
+                        help='PDF parsing backend (default: pymupdf; pdfplumber is slower but kept as a fallback)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes for PyMuPDF page extraction (default: CPU count, 1 disables)')
     
     args = parser.parse_args()
     
-    scraper = FinalScheduleScraper()
+    scraper = FinalScheduleScraper(backend=args.backend, workers=args.workers)
     
     if args.csv:
         # CSV export mode
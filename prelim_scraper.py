@@ -10,31 +10,111 @@
 
 import os
 import re
+import shutil
+import tempfile
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, time as datetime_time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator, NamedTuple
+import pandas as pd
 import pdfplumber
 from dotenv import load_dotenv
 from supabase import create_client, Client
-import pandas as pd
 from tabulate import tabulate
 
 # Load environment variables
 load_dotenv()
 
+# Precompiled patterns used on every table row
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(am|pm)?', re.IGNORECASE)
+_DATE_RE = re.compile(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+_GROUP_SUFFIX_RE = re.compile(r'\s+[A-E]$')
+_MONTH_RE = re.compile(r'January|February|March|April|May|June|July|August|September|October|November|December')
+
+# Dry-run columns: the key entries are matched on, and the columns fetched for existing
+# records, page by page (Supabase caps a single select at 1000 rows by default)
+_KEY_COLUMNS = ['date', 'session_id', 'platform', 'weight_class']
+_EXISTING_COLUMNS = 'date,session_id,platform,weight_class,start_time,weigh_in_time'
+_FETCH_PAGE_SIZE = 1000
+
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+_VALID_PLATFORMS = frozenset(('Red', 'White', 'Blue'))
+
+# Below this many pages, process start-up costs more than parallel table extraction saves
+PARALLEL_MIN_PAGES = 8
+
+# Upserts are sent in bounded batches (PostgREST payload limits) over a few concurrent requests
+UPSERT_CHUNK_SIZE = 500
+UPSERT_WORKERS = 4
+
+# OWLCMS schedules are ruled tables, so cells come from the drawn lines only
+_TABLE_SETTINGS = {'vertical_strategy': 'lines', 'horizontal_strategy': 'lines', 'snap_tolerance': 3}
+
+# PDF opened once per worker process by _init_page_worker
+_worker_pdf = None
+
+
+class ScheduleEntry(NamedTuple):
+    """A single schedule row, laid out like the session_schedule table"""
+    date: str
+    session_id: int
+    start_time: str
+    weigh_in_time: str
+    platform: str
+    weight_class: str
+    meet: str
+
+
+def _extract_page_tables(page) -> Tuple[List[List[List]], Optional[str]]:
+    """
+    Extract the tables from a single pdfplumber page
+    
+    Args:
+        page: pdfplumber page
+        
+    Returns:
+        Tuple of (tables, page text when table extraction found nothing - used for debugging output);
+        pages skipped for lacking a schedule header return ([], None)
+    """
+    text = page.extract_text() or ''
+    
+    # Only tables with a header row produce entries, and every header mentions 'Weigh'
+    # (Weigh / Weight Category), so skip the much more expensive table extraction without it
+    if 'weigh' not in text.lower():
+        return [], None
+    
+    tables = page.extract_tables(table_settings=_TABLE_SETTINGS)
+    return tables, None if tables else text
+
+
+def _init_page_worker(pdf_path: str):
+    """Open the PDF once in each worker instead of shipping it with every page"""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _extract_worker_page_tables(page_index: int) -> Tuple[List[List[List]], Optional[str]]:
+    """Process-pool entry point: extract tables from one page of the worker's PDF"""
+    return _extract_page_tables(_worker_pdf.pages[page_index])
+
 
 class ScheduleScraper:
     """Scraper for extracting schedule data from OWLCMS PDFs"""
     
-    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None):
+    def __init__(self, supabase_url: Optional[str] = None, supabase_key: Optional[str] = None,
+                 workers: Optional[int] = None):
         """
         Initialize the scraper with Supabase credentials
         
         Args:
             supabase_url: Supabase project URL (defaults to SUPABASE_URL env var)
             supabase_key: Supabase API key (defaults to SUPABASE_KEY env var)
+            workers: Worker processes for page extraction (defaults to CPU count, 1 disables)
         """
+        self.workers = workers or os.cpu_count() or 1
         self.supabase_url = supabase_url or os.getenv('SUPABASE_URL')
         self.supabase_key = supabase_key or os.getenv('SUPABASE_KEY')
         
@@ -42,32 +122,51 @@ class ScheduleScraper:
             raise ValueError("Supabase credentials not found. Set SUPABASE_URL and SUPABASE_KEY in .env")
         
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+        
+        # Shared keep-alive session so repeated downloads reuse connections (with retries on flaky links)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
     
-    def download_pdf(self, url: str) -> BytesIO:
+    def download_pdf(self, url: str) -> str:
         """
-        Download PDF from URL
+        Download PDF from URL to a temporary file
         
         Args:
             url: URL to the PDF file
             
         Returns:
-            BytesIO object containing the PDF data
+            Path to the downloaded PDF (the caller is responsible for removing it)
         """
         print(f"Downloading PDF from {url}...")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return BytesIO(response.content)
+        with self._session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            # Stream straight to disk so pdfplumber (and each worker) can open the file
+            # by path instead of holding the whole PDF in a BytesIO buffer
+            response.raw.decode_content = True
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as pdf_file:
+                try:
+                    shutil.copyfileobj(response.raw, pdf_file)
+                except Exception:
+                    # Don't leave a partial download behind in the temp dir
+                    pdf_file.close()
+                    os.remove(pdf_file.name)
+                    raise
+        
+        return pdf_file.name
     
-    def extract_schedule_data(self, pdf_file: BytesIO, meet_name: str) -> List[Dict]:
+    def extract_schedule_data(self, pdf_path: str, meet_name: str) -> List[ScheduleEntry]:
         """
         Extract schedule data from PDF
         
         Args:
-            pdf_file: BytesIO object containing PDF data
+            pdf_path: Path to the PDF file
             meet_name: Name of the meet/competition
             
         Returns:
-            List of dictionaries containing schedule entries
+            List of schedule entries
         """
         print("Extracting data from PDF...")
         schedule_entries = []
@@ -76,34 +175,57 @@ class ScheduleScraper:
         self.current_date = None
         self.current_session = None
         
-        with pdfplumber.open(pdf_file) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                print(f"Processing page {page_num}/{len(pdf.pages)}...")
-                
-                # Extract tables from the page
-                tables = page.extract_tables()
-                
-                if not tables:
-                    # Try extracting text if no tables found
-                    text = page.extract_text()
-                    if text:
-                        print(f"No tables found on page {page_num}, text extraction:")
-                        print(text[:500])  # Print first 500 chars for debugging
+        # Tables are extracted per page (possibly in parallel) but always parsed in page order,
+        # since _parse_table carries the current date/session from one table to the next
+        for page_num, (tables, text) in enumerate(self._iter_page_tables(pdf_path), 1):
+            if not tables:
+                # Show the page text if no tables found
+                if text:
+                    print(f"No tables found on page {page_num}, text extraction:")
+                    print(text[:500])  # Print first 500 chars for debugging
+                continue
+            
+            # Process each table
+            for table in tables:
+                if not table or len(table) < 2:
                     continue
                 
-                # Process each table
-                for table in tables:
-                    if not table or len(table) < 2:
-                        continue
-                    
-                    # Parse the table data
-                    entries = self._parse_table(table, meet_name)
-                    schedule_entries.extend(entries)
+                # Parse the table data
+                entries = self._parse_table(table, meet_name)
+                schedule_entries.extend(entries)
         
         print(f"Extracted {len(schedule_entries)} schedule entries")
         return schedule_entries
     
-    def _parse_table(self, table: List[List], meet_name: str) -> List[Dict]:
+    def _iter_page_tables(self, pdf_path: str) -> Iterator[Tuple[List[List[List]], Optional[str]]]:
+        """
+        Extract tables from every page, using a process pool for larger PDFs
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Iterator of (tables, fallback text) per page, in page order
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            
+            if self.workers < 2 or total_pages < PARALLEL_MIN_PAGES:
+                for page_num, page in enumerate(pdf.pages, 1):
+                    print(f"Processing page {page_num}/{total_pages}...")
+                    yield _extract_page_tables(page)
+                return
+        
+        # Every worker opens the whole PDF, so never start more of them than there are pages
+        workers = min(self.workers, total_pages)
+        print(f"Processing {total_pages} pages with {workers} workers...")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                                 initargs=(pdf_path,)) as executor:
+            for page_num, result in enumerate(executor.map(_extract_worker_page_tables, range(total_pages)), 1):
+                print(f"Processing page {page_num}/{total_pages}...")
+                yield result
+    
+    def _parse_table(self, table: List[List], meet_name: str) -> List[ScheduleEntry]:
         """
         Parse a table from the PDF into schedule entries
         
@@ -112,38 +234,40 @@ class ScheduleScraper:
             meet_name: Name of the meet
             
         Returns:
-            List of schedule entry dictionaries
+            List of schedule entries
         """
         entries = []
         
+        # Normalize every cell once; header detection, look-back and row parsing all reuse this
+        cleaned = [tuple('' if cell is None else str(cell).strip() for cell in row) for row in table]
+        
         # A table can have MULTIPLE header rows (multiple date sections)
         # We need to find ALL headers and process each section separately
         header_sections = []
         
-        for idx, row in enumerate(table):
-            if not row or all(cell is None or str(cell).strip() == '' for cell in row):
+        for idx, row in enumerate(cleaned):
+            if not any(row):
                 continue
             
-            row_text = ' '.join([str(cell or '').lower() for cell in row])
+            row_text = ' '.join(row).lower()
+            
+            # Without 'weigh' (also part of 'weight category') at most 3 keywords can match,
+            # so most data rows are rejected by this one check
+            if 'weigh' not in row_text:
+                continue
             
             # Look for common header keywords - must have multiple keywords to be a real header
-            keywords_found = sum([
-                'sess' in row_text,
-                'date' in row_text,
-                'plat' in row_text,
-                'weigh' in row_text,
-                'weight' in row_text and 'category' in row_text
-            ])
+            keywords_found = (1 + ('sess' in row_text) + ('date' in row_text) + ('plat' in row_text) +
+                              ('weight' in row_text and 'category' in row_text))
             
             if keywords_found >= 4:  # Must have at least 4 matching keywords
                 # Look for date in rows BEFORE this header (within 3 rows)
                 date_for_section = None
                 for look_back in range(1, min(4, idx + 1)):
-                    prev_row = table[idx - look_back]
+                    prev_row = cleaned[idx - look_back]
                     if prev_row:
-                        prev_text = ' '.join([str(cell or '').strip() for cell in prev_row])
-                        if any(month in prev_text for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                                  'July', 'August', 'September', 'October', 'November', 'December']):
+                        prev_text = ' '.join(prev_row)
+                        if _MONTH_RE.search(prev_text) is not None:
                             date_for_section = prev_text
                             break
                 
@@ -156,7 +280,7 @@ class ScheduleScraper:
         # Process rows BEFORE the first header (if any exist)
         if header_sections and header_sections[0]['start_idx'] > 1:
             # Parse rows before first header using the same header structure
-            pre_header_rows = table[0:header_sections[0]['start_idx'] - 1]
+            pre_header_rows = cleaned[0:header_sections[0]['start_idx'] - 1]
             if pre_header_rows:
                 # Don't pass date_text - let it use self.current_date which was carried over from previous table
                 # Pre-header rows are usually continuation from previous page
@@ -164,41 +288,42 @@ class ScheduleScraper:
         
         # Process each section
         if header_sections:
-            for i, section in enumerate(header_sections):
-                # Determine where this section ends (next header or end of table)
-                end_idx = header_sections[i + 1]['start_idx'] - 1 if i + 1 < len(header_sections) else len(table)
-                data_rows = table[section['start_idx']:end_idx]
+            # Each section ends where the next header row starts (or at the end of the table)
+            end_indices = [section['start_idx'] - 1 for section in header_sections[1:]] + [len(cleaned)]
+            for section, end_idx in zip(header_sections, end_indices):
+                data_rows = cleaned[section['start_idx']:end_idx]
                 
                 entries.extend(self._parse_with_headers(data_rows, section['header_row'], meet_name, section.get('date_text')))
         else:
             # Try to parse without explicit headers
             print("No clear header row found, attempting pattern-based parsing...")
-            entries.extend(self._parse_without_headers(table, meet_name))
+            entries.extend(self._parse_without_headers(cleaned, meet_name))
         
         return entries
     
-    def _parse_with_headers(self, data_rows: List[List], headers: List, meet_name: str, date_text: Optional[str] = None) -> List[Dict]:
-        """Parse table data using identified headers"""
+    def _parse_with_headers(self, data_rows: List[Tuple[str, ...]], headers: Tuple[str, ...], meet_name: str, date_text: Optional[str] = None) -> List[ScheduleEntry]:
+        """Parse table data using identified headers (rows are pre-cleaned by _parse_table)"""
         entries = []
         
-        # Normalize headers
+        # Normalize headers (cells are already stripped strings, so one lower/replace pass suffices)
         header_map = {}
-        for idx, header in enumerate(headers):
-            if header:
-                header_lower = str(header).lower().strip().replace('\n', ' ')
-                # Map to column indices - order matters! Check specific combinations first
-                if 'weight' in header_lower and 'category' in header_lower:
-                    header_map['weight_class_idx'] = idx
-                elif header_lower == 'weigh':  # Exact match for weigh-in time column
-                    header_map['weigh_idx'] = idx
-                elif 'date' in header_lower:
-                    header_map['date_idx'] = idx
-                elif 'sess' in header_lower:
-                    header_map['session_idx'] = idx
-                elif 'plat' in header_lower:
-                    header_map['platform_idx'] = idx
-                elif 'time' in header_lower:
-                    header_map['time_idx'] = idx
+        lowered = [header.lower().replace('\n', ' ') for header in headers]
+        for idx, header_lower in enumerate(lowered):
+            if not header_lower:
+                continue
+            # Map to column indices - order matters! Check specific combinations first
+            if 'weight' in header_lower and 'category' in header_lower:
+                header_map['weight_class_idx'] = idx
+            elif header_lower == 'weigh':  # Exact match for weigh-in time column
+                header_map['weigh_idx'] = idx
+            elif 'date' in header_lower:
+                header_map['date_idx'] = idx
+            elif 'sess' in header_lower:
+                header_map['session_idx'] = idx
+            elif 'plat' in header_lower:
+                header_map['platform_idx'] = idx
+            elif 'time' in header_lower:
+                header_map['time_idx'] = idx
         
         
         # When starting a new table with headers, look for a fresh date
@@ -220,9 +345,8 @@ class ScheduleScraper:
             for row in data_rows[:10]:  # Check first 10 rows for date
                 if not row or len(row) <= date_idx:
                     continue
-                date_cell = str(row[date_idx] or '').strip()
-                if date_cell and any(month in date_cell for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                                        'July', 'August', 'September', 'October', 'November', 'December']):
+                date_cell = row[date_idx]
+                if date_cell and _MONTH_RE.search(date_cell) is not None:
                     parsed_date = self._parse_date_from_text(date_cell)
                     if parsed_date:
                         local_date = parsed_date
@@ -230,16 +354,15 @@ class ScheduleScraper:
                         break
         
         for row in data_rows:
-            if not row or all(cell is None or str(cell).strip() == '' for cell in row):
+            if not any(row):
                 continue
             
             # Check if this row contains a date (like "Wednesday June 25, 2025")
             # This can happen when dates appear mid-table without a header
-            row_text = ' '.join([str(cell or '').strip() for cell in row])
-            if any(month in row_text for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                     'July', 'August', 'September', 'October', 'November', 'December']):
+            row_text = ' '.join(row)
+            if _MONTH_RE.search(row_text) is not None:
                 # Check if this looks like a date row (has day of week)
-                if any(day in row_text for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']):
+                if any(day in row_text for day in _WEEKDAY_NAMES):
                     parsed_date = self._parse_date_from_text(row_text)
                     if parsed_date:
                         local_date = parsed_date
@@ -255,12 +378,12 @@ class ScheduleScraper:
                 )
                 if entry:
                     # Update tracking
-                    if entry.get('date'):
-                        local_date = entry['date']
-                        self.current_date = entry['date']
-                    if entry.get('session_id'):
-                        local_session = entry['session_id']
-                        self.current_session = entry['session_id']
+                    if entry.date:
+                        local_date = entry.date
+                        self.current_date = entry.date
+                    if entry.session_id:
+                        local_session = entry.session_id
+                        self.current_session = entry.session_id
                     entries.append(entry)
             except Exception as e:
                 print(f"Error parsing row {row}: {e}")
@@ -268,7 +391,7 @@ class ScheduleScraper:
         
         return entries
     
-    def _parse_without_headers(self, table: List[List], meet_name: str) -> List[Dict]:
+    def _parse_without_headers(self, table: List[Tuple[str, ...]], meet_name: str) -> List[ScheduleEntry]:
         """Parse table data without explicit headers using pattern matching"""
         entries = []
         
@@ -287,10 +410,10 @@ class ScheduleScraper:
         
         return entries
     
-    def _extract_entry_from_row(self, row: List, header_map: Dict, meet_name: str, 
+    def _extract_entry_from_row(self, row: Tuple[str, ...], header_map: Dict, meet_name: str, 
                                  current_date: Optional[str] = None, 
-                                 current_session: Optional[int] = None) -> Optional[Dict]:
-        """Extract a single entry from a row using header mapping"""
+                                 current_session: Optional[int] = None) -> Optional[ScheduleEntry]:
+        """Extract a single entry from a pre-cleaned row using header mapping"""
         
         # Get indices from header map
         date_idx = header_map.get('date_idx', 0)
@@ -301,23 +424,23 @@ class ScheduleScraper:
         weight_class_idx = header_map.get('weight_class_idx', 7)
         
         # Extract raw values
-        date_str = str(row[date_idx] or '').strip() if date_idx < len(row) else ''
-        session_str = str(row[session_idx] or '').strip() if session_idx < len(row) else ''
-        platform = str(row[platform_idx] or '').strip() if platform_idx < len(row) else ''
-        weigh_time_str = str(row[weigh_idx] or '').strip() if weigh_idx < len(row) else ''
-        start_time_str = str(row[time_idx] or '').strip() if time_idx < len(row) else ''
-        weight_class = str(row[weight_class_idx] or '').strip() if weight_class_idx < len(row) else ''
+        row_len = len(row)
+        date_str = row[date_idx] if date_idx < row_len else ''
+        session_str = row[session_idx] if session_idx < row_len else ''
+        platform = row[platform_idx] if platform_idx < row_len else ''
+        weigh_time_str = row[weigh_idx] if weigh_idx < row_len else ''
+        start_time_str = row[time_idx] if time_idx < row_len else ''
+        weight_class = row[weight_class_idx] if weight_class_idx < row_len else ''
         
         # Skip rows that don't have essential data
-        if not platform or platform not in ['Red', 'White', 'Blue']:
+        if platform not in _VALID_PLATFORMS:
             return None
         
         if not start_time_str or not weigh_time_str:
             return None
         
         # Use current date/session if not provided in this row
-        if date_str and any(month in date_str for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                              'July', 'August', 'September', 'October', 'November', 'December']):
+        if date_str and _MONTH_RE.search(date_str) is not None:
             parsed_date = self._parse_date_from_text(date_str)
             if parsed_date:
                 current_date = parsed_date
@@ -337,19 +460,19 @@ class ScheduleScraper:
             return None
         
         # Clean up weight class (remove group letter like A, B, C, etc)
-        weight_class = re.sub(r'\s+[A-E]$', '', weight_class).strip()
-        
-        return {
-            'date': current_date,
-            'session_id': current_session,
-            'start_time': start_time.strftime('%H:%M:%S'),
-            'weigh_in_time': weigh_time.strftime('%H:%M:%S'),
-            'platform': platform,
-            'weight_class': weight_class,
-            'meet': meet_name
-        }
+        weight_class = _GROUP_SUFFIX_RE.sub('', weight_class).strip()
+        
+        return ScheduleEntry(
+            date=current_date,
+            session_id=current_session,
+            start_time=start_time.strftime('%H:%M:%S'),
+            weigh_in_time=weigh_time.strftime('%H:%M:%S'),
+            platform=platform,
+            weight_class=weight_class,
+            meet=meet_name
+        )
     
-    def _extract_entry_from_row_pattern(self, row: List, meet_name: str) -> Optional[Dict]:
+    def _extract_entry_from_row_pattern(self, row: List, meet_name: str) -> Optional[ScheduleEntry]:
         """Extract a single entry from a row using pattern matching"""
         # This is a placeholder - actual implementation depends on PDF structure
         return None
@@ -359,33 +482,25 @@ class ScheduleScraper:
         if not time_str:
             return None
         
-        time_str = str(time_str).strip()
+        # Handles 'HH:MM', 'HH:MM:SS' and 'H:MM am/pm' in one pass (no strptime/exception loop)
+        match = _TIME_RE.search(str(time_str).strip().lower())
+        if not match:
+            return None
         
-        # Try common time formats
-        formats = ['%H:%M:%S', '%H:%M', '%I:%M %p', '%I:%M%p']
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        second = int(match.group(3) or 0)
+        am_pm = match.group(4)
         
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(time_str, fmt)
-                return dt.time()
-            except ValueError:
-                continue
+        if am_pm == 'pm' and hour < 12:
+            hour += 12
+        elif am_pm == 'am' and hour == 12:
+            hour = 0
         
-        # Try to extract time using regex
-        match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', time_str.lower())
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            am_pm = match.group(3)
-            
-            if am_pm == 'pm' and hour < 12:
-                hour += 12
-            elif am_pm == 'am' and hour == 12:
-                hour = 0
-            
-            return datetime_time(hour, minute)
+        if hour > 23 or minute > 59 or second > 59:
+            return None
         
-        return None
+        return datetime_time(hour, minute, second)
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string into YYYY-MM-DD format"""
@@ -414,7 +529,7 @@ class ScheduleScraper:
         date_str = str(date_str).strip()
         
         # Try to extract month day year pattern
-        match = re.search(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_str)
+        match = _DATE_RE.search(date_str)
         if match:
             month_str = match.group(1)
             day = match.group(2)
@@ -429,7 +544,7 @@ class ScheduleScraper:
         # Fallback to regular parsing
         return self._parse_date(date_str)
     
-    def format_for_database(self, entries: List[Dict]) -> List[Dict]:
+    def format_for_database(self, entries: List[ScheduleEntry]) -> List[ScheduleEntry]:
         """
         Format extracted entries to match database schema
         
@@ -439,26 +554,40 @@ class ScheduleScraper:
         Returns:
             List of formatted entries ready for database insertion
         """
-        formatted = []
+        # Entries already follow the schema (they become dicts only when sent to Supabase),
+        # so formatting is just dropping those with a missing required field
+        return [entry for entry in entries if all(entry)]
+    
+    def _fetch_existing_records(self, meet_name: str) -> List[Dict]:
+        """
+        Fetch the existing records for a meet, only the columns needed for comparison
         
-        for entry in entries:
-            formatted_entry = {
-                'date': entry.get('date'),
-                'session_id': entry.get('session_id'),
-                'start_time': entry.get('start_time'),
-                'weigh_in_time': entry.get('weigh_in_time'),
-                'platform': entry.get('platform'),
-                'weight_class': entry.get('weight_class'),
-                'meet': entry.get('meet')
-            }
+        Args:
+            meet_name: Name of the meet
             
-            # Only add if all required fields are present
-            if all(formatted_entry.values()):
-                formatted.append(formatted_entry)
-        
-        return formatted
+        Returns:
+            List of existing records, fetched page by page
+        """
+        records = []
+        
+        while True:
+            # Order on the unique key within a meet so consecutive ranges neither overlap nor skip rows
+            response = (self.supabase.table('session_schedule')
+                        .select(_EXISTING_COLUMNS)
+                        .eq('meet', meet_name)
+                        .order('session_id')
+                        .order('platform')
+                        .order('weight_class')
+                        .range(len(records), len(records) + _FETCH_PAGE_SIZE - 1)
+                        .execute())
+            page = response.data or []
+            
+            # The server may cap pages below _FETCH_PAGE_SIZE (max-rows), so only an empty page ends the scan
+            if not page:
+                return records
+            records.extend(page)
     
-    def dry_run(self, meet_name: str, new_entries: List[Dict]) -> Dict:
+    def dry_run(self, meet_name: str, new_entries: List[ScheduleEntry]) -> Dict:
         """
         Perform a dry run to see what would be changed
         
@@ -474,52 +603,34 @@ class ScheduleScraper:
         print(f"{'='*60}\n")
         
         # Query existing records for this meet
-        existing_response = self.supabase.table('session_schedule').select('*').eq('meet', meet_name).execute()
-        existing_records = existing_response.data if existing_response.data else []
+        existing_records = self._fetch_existing_records(meet_name)
         
         print(f"Found {len(existing_records)} existing records for '{meet_name}'")
         print(f"Processing {len(new_entries)} new entries\n")
         
-        # Create a comparison
-        existing_by_key = {}
-        for record in existing_records:
-            key = (
-                record.get('date'),
-                record.get('session_id'),
-                record.get('platform'),
-                record.get('weight_class')
-            )
-            existing_by_key[key] = record
-        
-        new_by_key = {}
-        for entry in new_entries:
-            key = (
-                entry.get('date'),
-                entry.get('session_id'),
-                entry.get('platform'),
-                entry.get('weight_class')
-            )
-            new_by_key[key] = entry
+        # Join new entries against existing rows on the key columns; the row
+        # positions ride along so the details keep the original objects in PDF order
+        latest = list({(e.date, e.session_id, e.platform, e.weight_class): e for e in new_entries}.values())
+        df_new = pd.DataFrame(latest, columns=ScheduleEntry._fields)
+        df_new['new_pos'] = range(len(df_new))
+        df_old = pd.DataFrame(existing_records, columns=_EXISTING_COLUMNS.split(','))
+        df_old['existing_pos'] = range(len(df_old))
+        df_old = df_old.drop_duplicates(subset=_KEY_COLUMNS, keep='last')
         
-        # Determine what would be added/updated
-        to_add = []
-        to_update = []
-        unchanged = []
+        merged = df_new.merge(df_old, on=_KEY_COLUMNS, how='left', suffixes=('', '_old'), indicator=True)
         
-        for key, new_entry in new_by_key.items():
-            if key not in existing_by_key:
-                to_add.append(new_entry)
-            else:
-                existing = existing_by_key[key]
-                # Check if values differ
-                if (existing.get('start_time') != new_entry.get('start_time') or
-                    existing.get('weigh_in_time') != new_entry.get('weigh_in_time')):
-                    to_update.append({
-                        'existing': existing,
-                        'new': new_entry
-                    })
-                else:
-                    unchanged.append(new_entry)
+        # Determine what would be added/updated
+        in_existing = merged['_merge'] == 'both'
+        changed = ((merged['start_time'] != merged['start_time_old']) |
+                   (merged['weigh_in_time'] != merged['weigh_in_time_old']))
+        
+        to_add = [latest[pos] for pos in merged.loc[~in_existing, 'new_pos']]
+        updated = merged.loc[in_existing & changed]
+        to_update = [
+            {'existing': existing_records[int(old_pos)], 'new': latest[new_pos]}
+            for new_pos, old_pos in zip(updated['new_pos'], updated['existing_pos'])
+        ]
+        unchanged = [latest[pos] for pos in merged.loc[in_existing & ~changed, 'new_pos']]
         
         # Display summary
         print(f"SUMMARY:")
@@ -532,8 +643,7 @@ class ScheduleScraper:
             print(f"\n{'='*60}")
             print(f"NEW ENTRIES TO ADD ({len(to_add)}):")
             print(f"{'='*60}")
-            df = pd.DataFrame(to_add)
-            print(tabulate(df, headers='keys', tablefmt='grid', showindex=False))
+            print(tabulate(to_add, headers='keys', tablefmt='grid'))
         
         if to_update:
             print(f"\n{'='*60}")
@@ -543,14 +653,13 @@ class ScheduleScraper:
                 print(f"\nExisting:")
                 print(f"  {item['existing']}")
                 print(f"New:")
-                print(f"  {item['new']}")
+                print(f"  {item['new']._asdict()}")
         
         if unchanged:
             print(f"\n{'='*60}")
             print(f"UNCHANGED ENTRIES ({len(unchanged)}):")
             print(f"{'='*60}")
-            df = pd.DataFrame(unchanged)
-            print(tabulate(df, headers='keys', tablefmt='grid', showindex=False))
+            print(tabulate(unchanged, headers='keys', tablefmt='grid'))
         
         return {
             'total_new': len(new_entries),
@@ -565,15 +674,18 @@ class ScheduleScraper:
             }
         }
     
-    def upsert_to_database(self, entries: List[Dict]) -> Dict:
+    def upsert_to_database(self, entries: List[ScheduleEntry]) -> Dict:
         """
         Upsert entries to the database
         
+        Entries are sent in batches, so the upsert is not atomic: if a batch fails the others
+        stay committed, and a RuntimeError lists how far it got (re-running is safe).
+        
         Args:
             entries: List of formatted entries
             
         Returns:
-            Response from Supabase
+            Dictionary with the upserted rows from every batch and their count
         """
         if not entries:
             print("No entries to upsert")
@@ -582,7 +694,7 @@ class ScheduleScraper:
         # Deduplicate entries based on unique constraint
         seen = {}
         for entry in entries:
-            key = (entry['meet'], entry['session_id'], entry['platform'], entry['weight_class'])
+            key = (entry.meet, entry.session_id, entry.platform, entry.weight_class)
             seen[key] = entry
         
         deduplicated = list(seen.values())
@@ -590,18 +702,51 @@ class ScheduleScraper:
         if len(deduplicated) < len(entries):
             print(f"Warning: Removed {len(entries) - len(deduplicated)} duplicate entries from batch")
         
-        print(f"Upserting {len(deduplicated)} entries to database...")
+        starts = range(0, len(deduplicated), UPSERT_CHUNK_SIZE)
+        chunks = [deduplicated[i:i + UPSERT_CHUNK_SIZE] for i in starts]
+        print(f"Upserting {len(deduplicated)} entries to database in {len(chunks)} batch(es)...")
         
+        # Batches are network-bound and share the postgrest client's httpx connection pool, which
+        # supabase only creates on first access - do that here rather than racing in every thread
+        self.supabase.postgrest
+        with ThreadPoolExecutor(max_workers=min(UPSERT_WORKERS, len(chunks))) as executor:
+            futures = [executor.submit(self._upsert_chunk, chunk) for chunk in chunks]
+        
+        # Report every failed range rather than the first error, since the other batches stay committed
+        data = []
+        failed = []
+        for start, chunk, future in zip(starts, chunks, futures):
+            try:
+                data.extend(future.result().data)
+            except Exception as e:
+                failed.append(chunk)
+                print(f"ERROR: Failed to upsert entries {start + 1}-{start + len(chunk)}: {e}")
+        
+        if failed:
+            upserted = len(deduplicated) - sum(len(chunk) for chunk in failed)
+            raise RuntimeError(f"{len(failed)} of {len(chunks)} batch(es) failed after {upserted} entries were "
+                               f"upserted; re-run to upsert the remaining entries")
+        
+        print(f"Successfully upserted {len(deduplicated)} entries")
+        return {'data': data, 'count': len(deduplicated)}
+    
+    def _upsert_chunk(self, chunk: List[ScheduleEntry]):
+        """
+        Upsert a single batch of entries
+        
+        Args:
+            chunk: List of deduplicated, formatted entries
+            
+        Returns:
+            Response from Supabase
+        """
         # Unique constraint is meet + session_id + platform + weight_class
-        response = self.supabase.table('session_schedule').upsert(
-            deduplicated,
+        return self.supabase.table('session_schedule').upsert(
+            [entry._asdict() for entry in chunk],
             on_conflict='meet,session_id,platform,weight_class'
         ).execute()
-        
-        print(f"Successfully upserted {len(deduplicated)} entries")
-        return response
     
-    def export_to_csv(self, entries: List[Dict], output_file: str):
+    def export_to_csv(self, entries: List[ScheduleEntry], output_file: str):
         """Export entries to CSV file"""
         import csv
         
@@ -618,7 +763,7 @@ class ScheduleScraper:
             writer.writeheader()
             for i, entry in enumerate(entries, 1):
                 # Add id field for CSV (not used in database)
-                row = {'id': i, **entry}
+                row = {'id': i, **entry._asdict()}
                 writer.writerow(row)
         
         print(f"✓ Successfully exported to {output_file}")
@@ -637,10 +782,13 @@ class ScheduleScraper:
         """
         try:
             # Download PDF
-            pdf_file = self.download_pdf(pdf_url)
+            pdf_path = self.download_pdf(pdf_url)
             
             # Extract data
-            raw_entries = self.extract_schedule_data(pdf_file, meet_name)
+            try:
+                raw_entries = self.extract_schedule_data(pdf_path, meet_name)
+            finally:
+                os.remove(pdf_path)
             
             if not raw_entries:
                 print("WARNING: No schedule entries were extracted from the PDF")
@@ -678,15 +826,20 @@ def main():
     parser.add_argument('meet_name', help='Name of the meet/competition')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without actually upserting')
     parser.add_argument('--csv', help='Export to CSV file instead of database (provide filename)')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes for page extraction (default: CPU count, 1 disables)')
     
     args = parser.parse_args()
     
-    scraper = ScheduleScraper()
+    scraper = ScheduleScraper(workers=args.workers)
     
     if args.csv:
         # CSV export mode
-        pdf_file = scraper.download_pdf(args.url)
-        raw_entries = scraper.extract_schedule_data(pdf_file, args.meet_name)
+        pdf_path = scraper.download_pdf(args.url)
+        try:
+            raw_entries = scraper.extract_schedule_data(pdf_path, args.meet_name)
+        finally:
+            os.remove(pdf_path)
         formatted_entries = scraper.format_for_database(raw_entries)
         
         if formatted_entries: